@@ -14,21 +14,349 @@ builder.write('doc_dir')
 
 from __future__ import annotations
 
+import functools
 import inspect
-import pkgutil
+import linecache
+import os
 import sys
-import traceback
 import types
-import warnings
-from functools import cached_property
-from typing import Any, Generic, NamedTuple, TypeVar, Union
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    NamedTuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
-from typing_extensions import override
+from typing_extensions import Self, override
 
-from sophia_doc.utils import import_module
+from sophia_doc.cache import clear_caches, identity_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Container, Mapping
 
 _T = TypeVar("_T")
 
+_KIND_BY_TYPE: dict[type[Any], str] = {
+    types.FunctionType: "method",
+    types.MethodDescriptorType: "method",
+    types.WrapperDescriptorType: "method",
+    staticmethod: "static method",
+    types.BuiltinMethodType: "static method",
+    classmethod: "class method",
+    types.ClassMethodDescriptorType: "class method",
+}
+# the types which inspect.getfile accepts, besides modules
+_FILE_TYPES = (
+    type,
+    types.MethodType,
+    types.FunctionType,
+    types.TracebackType,
+    types.FrameType,
+    types.CodeType,
+)
+# the types which inspect._finddoc handles, besides descriptors
+_DOC_BEARING_TYPES = (
+    type,
+    types.MethodType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    property,
+)
+_SOURCE_CACHE: dict[str, str] = {}
+
+
+class cached_property(Generic[_T]):  # noqa: N801
+    """A lock-free version of functools.cached_property.
+
+    functools.cached_property acquires a lock on the first access of every
+    instance before Python 3.12, which is unnecessary for document nodes.
+
+    The value is cached in the attribute named `_cached_<name>`, so a class
+    which defines __slots__ must declare it.
+    """
+
+    func: Callable[[Any], _T]
+    attrname: str | None
+
+    def __init__(self, func: Callable[[Any], _T]) -> None:
+        """Init cached_property."""
+        super().__init__()
+        self.func = func
+        self.attrname = None
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type[Any], name: str) -> None:
+        """Set the name of the attribute to cache the value."""
+        self.attrname = "_cached_" + name
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type[Any] | None = None) -> _T: ...
+
+    def __get__(self, instance: object, owner: type[Any] | None = None) -> Any:
+        """Get the cached value, compute it on the first access."""
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.attrname)  # type: ignore
+        except AttributeError:
+            pass
+        val = self.func(instance)
+        setattr(instance, self.attrname, val)  # type: ignore
+        return val
+
+
+# the non-data descriptors which ClassNode.attributes handles without binding
+_RAW_DESCRIPTOR_TYPES = (
+    types.FunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+    types.ClassMethodDescriptorType,
+    staticmethod,
+    classmethod,
+    functools.cached_property,
+    cached_property,
+)
+
+
+def _needs_binding(value: object) -> bool:
+    """Returns True if a class attribute has to be bound to the class first.
+
+    Non-data descriptors not in _RAW_DESCRIPTOR_TYPES, like
+    functools.partialmethod, only give the documented object when bound.
+    """
+    return (
+        hasattr(type(value), "__get__")
+        and not isinstance(value, _RAW_DESCRIPTOR_TYPES)
+        and not inspect.isdatadescriptor(value)
+    )
+
+
+@functools.cache
+def _resolve_qualname(module_name: str, path: tuple[str, ...]) -> Any:
+    """Resolve a dotted path in a module, the result is cached."""
+    obj = sys.modules.get(module_name)
+    if obj is None:
+        return None
+    for name in path:
+        obj = getattr(obj, name)
+    return obj
+
+
+def _find_class(func: Callable[..., Any]) -> type[Any] | None:
+    """Find the class which defines a function, cut from inspect._findclass."""
+    cls = _resolve_qualname(func.__module__, tuple(func.__qualname__.split(".")[:-1]))
+    if not inspect.isclass(cls):
+        return None
+    return cls
+
+
+def _mro_find_doc(cls: type[Any], name: str) -> str | None:
+    """Find the first docstring of an attribute along the mro of a class."""
+    for base in cls.__mro__:
+        try:
+            doc = getattr(base, name).__doc__
+        except AttributeError:
+            continue
+        if doc is not None:
+            return doc
+    return None
+
+
+_cached_find_doc = functools.cache(_mro_find_doc)
+
+
+def _find_doc_for(cls: type[Any], name: str) -> str | None:
+    """Find the docstring of an attribute of a class, cached if possible."""
+    try:
+        return _cached_find_doc(cls, name)
+    except TypeError:
+        # unhashable class
+        return _mro_find_doc(cls, name)
+
+
+def _may_inherit_doc(obj: object) -> bool:
+    """Returns False for plain data, which can not inherit a docstring."""
+    if isinstance(obj, _DOC_BEARING_TYPES):
+        return True
+    obj_type = type(obj)
+    return (
+        hasattr(obj_type, "__get__")
+        or hasattr(obj_type, "__set__")
+        or hasattr(obj_type, "__delete__")
+    )
+
+
+def _find_doc(obj: Any) -> str | None:  # noqa: PLR0911
+    """Find the inherited docstring of an object, cut from inspect._finddoc."""
+    # plain data can not match any branch below, return early for it, the check
+    # is a separate function so that it does not narrow the type of obj
+    if not _may_inherit_doc(obj):
+        return None
+
+    if inspect.isclass(obj):
+        for base in obj.__mro__:
+            if base is not object:
+                try:
+                    doc = base.__doc__
+                except AttributeError:
+                    continue
+                if doc is not None:
+                    return doc
+        return None
+
+    name: str
+    cls: type[Any] | None
+    if inspect.ismethod(obj):
+        name = obj.__func__.__name__
+        self = obj.__self__
+        if (
+            inspect.isclass(self)
+            and getattr(getattr(self, name, None), "__func__") is obj.__func__  # noqa: B009
+        ):
+            # classmethod
+            cls = self
+        else:
+            cls = self.__class__
+    elif inspect.isfunction(obj):
+        name = obj.__name__
+        cls = _find_class(obj)
+        if cls is None:
+            return None
+        attr = getattr(cls, name)
+        # the function of a class method is bound to the class
+        if getattr(attr, "__func__", attr) is not obj:
+            return None
+    elif inspect.isbuiltin(obj):
+        name = obj.__name__
+        self = obj.__self__
+        if inspect.isclass(self) and self.__qualname__ + "." + name == obj.__qualname__:
+            # classmethod
+            cls = self
+        else:
+            cls = self.__class__
+    # Should be tested before isdatadescriptor().
+    elif isinstance(obj, property):
+        func = obj.fget
+        if func is None:
+            return None
+        name = func.__name__
+        cls = _find_class(func)
+        if cls is None or getattr(cls, name) is not obj:
+            return None
+    elif inspect.ismethoddescriptor(obj) or inspect.isdatadescriptor(obj):
+        # the narrowed descriptor protocols do not declare these attributes
+        name = getattr(obj, "__name__")  # noqa: B009
+        objclass: type[Any] = getattr(obj, "__objclass__")  # noqa: B009
+        cls = objclass
+        if getattr(cls, name) is not obj:
+            return None
+        if inspect.ismemberdescriptor(obj):
+            slots: object = getattr(cls, "__slots__", None)
+            # a dict __slots__ maps the names to their docstrings
+            if isinstance(slots, dict) and name in slots:
+                return cast("dict[str, str | None]", slots)[name]
+    else:
+        return None
+    return _find_doc_for(cls, name)
+
+
+def _getdoc(obj: Any) -> str | None:
+    """Get the documentation string for an object, cut from inspect.getdoc."""
+    try:
+        doc = obj.__doc__
+    except AttributeError:
+        return None
+    if doc is None:
+        try:
+            doc = _find_doc(obj)
+        except (AttributeError, TypeError):
+            return None
+    if not isinstance(doc, str):
+        return None
+    return inspect.cleandoc(doc)
+
+
+@identity_cache
+def _signature(obj: Callable[..., Any]) -> inspect.Signature | None:
+    """Get the signature of a callable object, the result is cached."""
+    try:
+        return inspect.signature(obj)
+    except (ValueError, TypeError):
+        return None
+
+
+@functools.cache
+def _cached_getcomments(obj: Any) -> str | None:
+    """A cached version of inspect.getcomments."""
+    return inspect.getcomments(obj)
+
+
+def _getcomments(obj: Any) -> str | None:
+    """Get the comments above an object, the result is cached if possible."""
+    try:
+        return _cached_getcomments(obj)
+    except TypeError:
+        # unhashable object
+        return inspect.getcomments(obj)
+
+
+def _getmodule(obj: Any) -> types.ModuleType | None:
+    """Same as inspect.getmodule, for objects without __module__ only.
+
+    inspect.getmodule can only find a module by the source file, which exists
+    for few kinds of objects, so skip it for the others (int, str, list, ...).
+    """
+    if not isinstance(obj, _FILE_TYPES):
+        return None
+    return inspect.getmodule(obj)
+
+
+def _import_workers() -> int:
+    """The number of threads used to import submodules.
+
+    Read from the SOPHIA_DOC_IMPORT_WORKERS environment variable, submodules
+    are imported serially by default since importing a module may have side
+    effects which are not thread-safe.
+    """
+    try:
+        return int(os.environ.get("SOPHIA_DOC_IMPORT_WORKERS", "1"))
+    except ValueError:
+        return 1
+
+
+def _import_submodule(name: str) -> types.ModuleType:
+    """Import a module, skip the import machinery if it is already imported."""
+    from sophia_doc.utils import import_module  # noqa: PLC0415
+
+    return sys.modules.get(name) or import_module(name)
+
+
+def _module_node(name: str) -> ModuleNode:
+    """Rebuild a ModuleNode from the module name, used to unpickle it."""
+    return ModuleNode(_import_submodule(name))
+
+
+def clear_cache() -> None:
+    """Clear the introspection caches used by sophia_doc.
+
+    Results are cached for the whole process, call this before documenting
+    modules again after they have been changed or reloaded.
+    """
+    _resolve_qualname.cache_clear()
+    _cached_find_doc.cache_clear()
+    _cached_getcomments.cache_clear()
+    _SOURCE_CACHE.clear()
+    # the identity caches and the caches registered by other modules
+    clear_caches()
+
 
 def getdoc(obj: Any) -> str:
     """Get the documentation string for an object if it is not inherited from its class.
@@ -45,7 +373,7 @@ def getdoc(obj: Any) -> str:
                 return ""
     except AttributeError:
         pass
-    return inspect.getdoc(obj) or ""
+    return _getdoc(obj) or ""
 
 
 def isdata(obj: object) -> bool:
@@ -61,7 +389,7 @@ def isdata(obj: object) -> bool:
     )
 
 
-def is_visible_name(name: str, _all: list[str] | None = None) -> bool:
+def is_visible_name(name: str, _all: Container[str] | None = None) -> bool:
     """Decide whether to show documentation on a variable.
 
     Args:
@@ -71,22 +399,24 @@ def is_visible_name(name: str, _all: list[str] | None = None) -> bool:
     Returns:
         Show documentation on a variable or not.
     """
-    if name == "__init__":
-        return True
-    # only document that which the programmer exported in __all__
+    # only document that which the programmer exported in __all__,
+    # __init__ is always visible but rare, so it is checked last
     if _all is not None:
-        return name in _all
-    return not name.startswith("_")
+        return name in _all or name == "__init__"
+    return not name.startswith("_") or name == "__init__"
 
 
+@identity_cache
 def get_annotations(obj: Any) -> dict[str, Any]:
     """Get the annotations dict for an object."""
     # refs: https://docs.python.org/3/howto/annotations.html
     if sys.version_info >= (3, 10):
-        return inspect.get_annotations(obj)
-    if isinstance(obj, type):
-        return obj.__dict__.get("__annotations__", {})
-    return getattr(obj, "__annotations__", {})
+        annotations = inspect.get_annotations(obj)
+    elif isinstance(obj, type):
+        annotations = obj.__dict__.get("__annotations__", {})
+    else:
+        annotations = getattr(obj, "__annotations__", {})
+    return annotations
 
 
 class DocNode(Generic[_T]):
@@ -98,7 +428,18 @@ class DocNode(Generic[_T]):
         module: The module of this object.
     """
 
-    __slots__ = ("obj", "name", "module", "_qualname")
+    # the _cached_* slots are set by cached_property on first access
+    __slots__ = (
+        "obj",
+        "name",
+        "module",
+        "_qualname",
+        "_cached_annotations",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_comments",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_docstring",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_qualname",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_realname",  # pyright: ignore[reportUninitializedInstanceVariable]
+    )
     obj: _T
     name: str
     module: ModuleNode
@@ -130,7 +471,12 @@ class DocNode(Generic[_T]):
     @cached_property
     def docstring(self) -> str:
         """Docstring of this object."""
-        return getdoc(self.obj) or inspect.getcomments(self.obj) or ""
+        return getdoc(self.obj)
+
+    @cached_property
+    def comments(self) -> str:
+        """The comments above the source of this object."""
+        return _getcomments(self.obj) or ""
 
     @staticmethod
     def from_obj(
@@ -147,6 +493,14 @@ class DocNode(Generic[_T]):
         Returns:
             A DocNode object.
         """
+        obj_type = type(cast("object", obj))
+        node_class = _KIND_DISPATCH.get(obj_type)
+        if node_class is None and issubclass(obj_type, type):
+            # a class with a custom metaclass
+            node_class = ClassNode
+        if node_class is not None:
+            return node_class(obj, name, qualname, module)
+
         try:
             if inspect.ismodule(obj):
                 return ModuleNode(obj)
@@ -154,9 +508,13 @@ class DocNode(Generic[_T]):
                 return ClassNode(obj, name, qualname, module)
             if inspect.isroutine(obj):
                 return FunctionNode(obj, name, qualname, module)
+            # not a module, class or routine, see isdata
+            is_data = not isinstance(
+                obj, (types.FrameType, types.TracebackType, types.CodeType)
+            )
         except AttributeError:
-            pass
-        if isdata(obj):
+            is_data = isdata(obj)
+        if is_data:
             return DataNode(obj, name, qualname, module)
         return OtherNode(obj, name, qualname, module)
 
@@ -169,47 +527,126 @@ class DocNode(Generic[_T]):
         )
 
 
+class _AttributeGroups(NamedTuple):
+    """The attributes of a module grouped by kind."""
+
+    classes: list[ClassNode]
+    functions: list[FunctionNode]
+    data: list[DataNode[Any]]
+
+
 class ModuleNode(DocNode[types.ModuleType]):
     """The class of module node."""
 
+    # the _cached_* slots are set by cached_property on first access
+    __slots__ = (
+        "_cached__grouped_attributes",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_attributes",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_file",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_is_namespace",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_is_package",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_source",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_submodules",  # pyright: ignore[reportUninitializedInstanceVariable]
+    )
+
     def __init__(self, obj: types.ModuleType) -> None:
         """Init ModuleNode."""
         super().__init__(obj, obj.__name__, "", self)
 
+    @override
+    def __reduce__(self) -> tuple[Callable[[str], ModuleNode], tuple[str]]:
+        """Pickle the module by its name, it is imported again when unpickled."""
+        return _module_node, (self.name,)
+
     @cached_property
     def attributes(self) -> list[DocNode[Any]]:
         """A list of attributes of this module."""
         _all = getattr(self.obj, "__all__", None)
+        if _all is not None:
+            _all = frozenset(_all)
+        own_name: str | None = self.obj.__name__
+        if sys.modules.get(own_name) is not self.obj:
+            own_name = None
         attributes: list[DocNode[Any]] = []
-        for key, value in list(getattr(self.obj, "__dict__", {}).items()):
-            if (inspect.getmodule(value) or self.obj) is self.obj and is_visible_name(
-                key, _all
-            ):
-                attributes.append(self.from_obj(value, key, key, self))
+        module_dict = getattr(self.obj, "__dict__", {})
+        # snapshot only the keys, most of the names are filtered out below
+        for key in tuple(module_dict):
+            if not is_visible_name(key, _all) or key not in module_dict:
+                continue
+            value = module_dict[key]
+            # same as `(inspect.getmodule(value) or self.obj) is self.obj`,
+            # but only fall back to inspect.getmodule without __module__
+            if isinstance(value, types.ModuleType):
+                if value is not self.obj:
+                    continue
+            else:
+                modname = getattr(value, "__module__", None)
+                if modname is None:
+                    if (_getmodule(value) or self.obj) is not self.obj:
+                        continue
+                elif (
+                    modname != own_name
+                    and (sys.modules.get(modname) or self.obj) is not self.obj
+                ):
+                    continue
+            attributes.append(self.from_obj(value, key, key, self))
         return attributes
 
     @cached_property
     def submodules(self) -> list[ModuleNode]:
         """A list of submodules of this module."""
+        # only needed here, import lazily to keep `import sophia_doc` cheap
+        import pkgutil  # noqa: PLC0415
+        import traceback  # noqa: PLC0415
+        import warnings  # noqa: PLC0415
+
         submodules: list[ModuleNode] = []
         submodule_names: set[str] = set()
         if self.is_package:
-            for _importer, modname, _ispkg in pkgutil.iter_modules(self.obj.__path__):
-                if not is_visible_name(modname):
-                    continue
+            modnames = [
+                modname
+                for _importer, modname, _ispkg in pkgutil.iter_modules(
+                    self.obj.__path__
+                )
+                if is_visible_name(modname)
+            ]
+            submodule_names.update(modnames)
+            fullnames = [self.name + "." + modname for modname in modnames]
+            getters: list[Callable[[], types.ModuleType]]
+            workers = _import_workers()
+            if workers > 1 and len(fullnames) > 1:
+                from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(_import_submodule, fullname)
+                        for fullname in fullnames
+                    ]
+                # collect the results in submission order
+                getters = [future.result for future in futures]
+            else:
+                getters = [
+                    functools.partial(_import_submodule, fullname)
+                    for fullname in fullnames
+                ]
+            for modname, get_module in zip(modnames, getters):
                 try:
-                    submodule_names.add(modname)
-                    module = import_module(self.name + "." + modname)
-                    submodules.append(ModuleNode(module))
-                except ImportError:
+                    submodules.append(ModuleNode(get_module()))
+                except ImportError:  # noqa: PERF203
                     warnings.warn(
                         f"Can not import {modname}:\n{traceback.format_exc()}",
                         stacklevel=1,
                     )
 
-        for key, value in inspect.getmembers(self.obj, inspect.ismodule):
+        # look values up in __dict__ directly, unlike inspect.getmembers this
+        # never calls getattr, but still honors a module level __dir__
+        prefix = self.name + "."
+        module_dict = getattr(self.obj, "__dict__", {})
+        for key in dir(self.obj):
+            value = module_dict.get(key)
             if (
-                value.__name__.startswith(self.name + ".")
+                isinstance(value, types.ModuleType)
+                and value.__name__.startswith(prefix)
                 and key not in submodule_names
             ):
                 submodules.append(ModuleNode(value))
@@ -226,6 +663,8 @@ class ModuleNode(DocNode[types.ModuleType]):
     @cached_property
     def source(self) -> str | None:
         """The source of this module."""
+        if self.is_namespace:
+            return None
         loader = getattr(self.obj, "__loader__", None)
         if loader and getattr(loader, "get_source", None):
             try:
@@ -234,10 +673,26 @@ class ModuleNode(DocNode[types.ModuleType]):
                     return source
             except ImportError:
                 pass
+        # read the file through linecache like inspect.getsource, but without
+        # inspect.findsource, and share the result between module nodes
         try:
-            return inspect.getsource(self.obj)
-        except OSError:
+            file = inspect.getsourcefile(self.obj)
+        except TypeError:
+            # built-in module
             return None
+        if file is None:
+            file = inspect.getfile(self.obj)
+            if not (file.startswith("<") and file.endswith(">")):
+                return None
+        source = _SOURCE_CACHE.get(file)
+        if source is None:
+            # drop stale linecache entries like inspect.findsource does
+            linecache.checkcache(file)
+            lines = linecache.getlines(file, self.obj.__dict__)
+            if not lines:
+                return None
+            source = _SOURCE_CACHE[file] = "".join(lines)
+        return source
 
     @cached_property
     def is_package(self) -> bool:
@@ -247,27 +702,52 @@ class ModuleNode(DocNode[types.ModuleType]):
     @cached_property
     def is_namespace(self) -> bool:
         """Returns True if this module is a namespace package."""
-        return hasattr(self.obj, "__path__") and not hasattr(self.obj, "__file__")
+        # __file__ is None for namespace packages since Python 3.7
+        return (
+            hasattr(self.obj, "__path__")
+            and getattr(self.obj, "__file__", None) is None
+        )
 
     @cached_property
+    def _grouped_attributes(self) -> _AttributeGroups:
+        """This module's attributes split by kind in a single pass."""
+        groups = _AttributeGroups([], [], [])
+        for node in self.attributes:
+            if isinstance(node, ClassNode):
+                groups.classes.append(node)
+            elif isinstance(node, FunctionNode):
+                groups.functions.append(node)
+            elif isinstance(node, DataNode):
+                groups.data.append(node)
+        return groups
+
+    @property
     def classes(self) -> list[ClassNode]:
         """A list of class objects in this module's attributes."""
-        return [i for i in self.attributes if isinstance(i, ClassNode)]
+        return self._grouped_attributes.classes
 
-    @cached_property
+    @property
     def functions(self) -> list[FunctionNode]:
         """A list of function objects in this module's attributes."""
-        return [i for i in self.attributes if isinstance(i, FunctionNode)]
+        return self._grouped_attributes.functions
 
-    @cached_property
+    @property
     def data(self) -> list[DataNode[Any]]:
         """A list of data objects in module's this attributes."""
-        return [i for i in self.attributes if isinstance(i, DataNode)]
+        return self._grouped_attributes.data
 
 
 class ClassNode(DocNode[type[Any]]):
     """The class of class node."""
 
+    __slots__ = (
+        "_cached_attributes",
+        "_cached_bases",
+        "_cached_is_abstract",
+        "_cached_mro",
+        "_cached_subclasses",
+    )
+
     class Attribute(NamedTuple):
         """The attribute of a class."""
 
@@ -279,42 +759,57 @@ class ClassNode(DocNode[type[Any]]):
     def attributes(self) -> list[ClassNode.Attribute]:
         """A list of attributes of this class."""
         attributes: list[ClassNode.Attribute] = []
-        for name in filter(is_visible_name, dir(self.obj)):
-            if name not in self.obj.__dict__ and name not in getattr(
-                self.obj, "__slots__", []
-            ):
+        own = self.obj.__dict__
+        # enum members are stored as descriptors in the class __dict__
+        members: Mapping[str, Any] = (
+            self.obj.__members__ if issubclass(self.obj, Enum) else {}
+        )
+        # names in __slots__ are in __dict__ too, as member descriptors
+        slots = getattr(self.obj, "__slots__", None) or ()
+        slots = frozenset((slots,) if isinstance(slots, str) else slots)
+        qual_prefix = self.qualname + "."
+        module = self.module
+        for name in sorted(own):
+            if not is_visible_name(name):
                 continue
 
-            value = getattr(self.obj, name)
-
-            if isinstance(value, (staticmethod, types.BuiltinMethodType)):
-                kind = "static method"
-            elif isinstance(value, (classmethod, types.ClassMethodDescriptorType)):
-                kind = "class method"
-            elif isinstance(value, property):
-                kind = "readonly property" if value.fset is None else "property"
-            elif inspect.isroutine(value):
-                kind = "method"
-            elif inspect.isdatadescriptor(value):
-                # ignore data descriptor create by __slots__
-                if name in getattr(self.obj, "__slots__", []):
-                    continue
-                kind = "data descriptor"
+            value: object
+            if name in members:
+                value = members[name]
             else:
-                kind = "data"
+                value = own[name]
+                if _needs_binding(value):
+                    value = getattr(self.obj, name, value)
+
+            # the common types are classified by a single dict lookup
+            kind = _KIND_BY_TYPE.get(type(value))
+            if kind is None:
+                if isinstance(value, (staticmethod, types.BuiltinMethodType)):
+                    kind = "static method"
+                elif isinstance(value, (classmethod, types.ClassMethodDescriptorType)):
+                    kind = "class method"
+                elif isinstance(value, property):
+                    kind = "readonly property" if value.fset is None else "property"
+                elif inspect.isroutine(value):
+                    kind = "method"
+                elif inspect.isdatadescriptor(value):
+                    # ignore data descriptor create by __slots__
+                    if name in slots:
+                        continue
+                    kind = "data descriptor"
+                else:
+                    kind = "data"
 
             # get original function from class method or static method
             if isinstance(value, (staticmethod, classmethod)):
                 value = value.__func__  # type: ignore
 
             # functools.cached_property needs special handling
-            if isinstance(value, cached_property):
+            if isinstance(value, (functools.cached_property, cached_property)):
                 kind = "cached property"
-                node = DataNode(value, name, self.qualname + "." + name, self.module)
+                node = DataNode(value, name, qual_prefix + name, module)
             else:
-                node = DocNode.from_obj(
-                    value, name, self.qualname + "." + name, self.module
-                )
+                node = DocNode.from_obj(value, name, qual_prefix + name, module)
 
             attributes.append(self.Attribute(name, kind, node))
 
@@ -333,14 +828,17 @@ class ClassNode(DocNode[type[Any]]):
     def bases(self) -> tuple[str, ...]:
         """Base class names of this class."""
         return tuple(
-            (x.__module__ + "." if x.__module__ != "builtins" else "") + x.__qualname__
+            f"{x.__module__}.{x.__qualname__}"
+            if x.__module__ != "builtins"
+            else x.__qualname__
             for x in self.obj.__bases__
         )
 
     @cached_property
     def mro(self) -> tuple[type, ...]:
         """The mro of this class."""
-        return inspect.getmro(self.obj)
+        # the class keeps its own mro tuple, no need to go through inspect
+        return self.obj.__mro__
 
     @cached_property
     def is_abstract(self) -> bool:
@@ -362,13 +860,18 @@ class FunctionNode(
 ):
     """The class of function node."""
 
+    # the _cached_* slots are set by cached_property on first access
+    __slots__ = (
+        "_cached_is_async",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_is_bound_method",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_is_lambda_func",  # pyright: ignore[reportUninitializedInstanceVariable]
+        "_cached_signature",  # pyright: ignore[reportUninitializedInstanceVariable]
+    )
+
     @cached_property
     def signature(self) -> inspect.Signature | None:
         """Signature of this function."""
-        try:
-            return inspect.signature(self.obj)
-        except (ValueError, TypeError):
-            return None
+        return _signature(self.obj)
 
     @cached_property
     def is_async(self) -> bool:
@@ -396,15 +899,33 @@ class FunctionNode(
 class DataNode(DocNode[_T]):
     """The class of data node."""
 
+    __slots__ = ()
+
     @cached_property
     def annotations(self) -> dict[str, Any]:
         """Annotations of this object."""
         if isinstance(self.obj, property):
             return get_annotations(self.obj.fget)
-        if isinstance(self.obj, cached_property):
+        if isinstance(self.obj, (functools.cached_property, cached_property)):
             return get_annotations(self.obj.func)  # type: ignore
         return get_annotations(self.obj)
 
 
 class OtherNode(DocNode[_T]):
     """The class of other node."""
+
+    __slots__ = ()
+
+
+_KIND_DISPATCH: dict[type[Any], type[DocNode[Any]]] = {
+    type: ClassNode,
+    types.FunctionType: FunctionNode,
+    types.MethodType: FunctionNode,
+    types.BuiltinFunctionType: FunctionNode,
+    types.MethodDescriptorType: FunctionNode,
+    types.WrapperDescriptorType: FunctionNode,
+    types.ClassMethodDescriptorType: FunctionNode,
+    staticmethod: FunctionNode,
+    classmethod: FunctionNode,
+    property: DataNode,
+}
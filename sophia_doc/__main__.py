@@ -6,81 +6,102 @@ import argparse
 
 from docstring_parser import DocstringStyle
 
-from sophia_doc import ModuleNode
+from sophia_doc import ModuleNode, clear_cache
 from sophia_doc.builders.markdown import MarkdownBuilder
 from sophia_doc.utils import import_module
 
-parser = argparse.ArgumentParser(
-    description="Sophia_doc is a python package to automatically "
-    "generate API documents for Python modules",
-    formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-)
-parser.add_argument("module", type=str, help="Python module names.")
-parser.add_argument(
-    "-o",
-    "--output-dir",
-    type=str,
-    default="doc",
-    help="The directory to write document.",
-)
-parser.add_argument(
-    "-f",
-    "--format",
-    type=str,
-    default="markdown",
-    help="File format of document.",
-)
-parser.add_argument(
-    "--docstring-style",
-    type=str,
-    default="auto",
-    help="Docstring style the python module used.",
-)
-parser.add_argument(
-    "--ignore-data",
-    type=bool,
-    action=argparse.BooleanOptionalAction,
-    default=False,
-    help="Ignore data in Markdown text.",
-)
-parser.add_argument(
-    "--anchor-extend",
-    type=bool,
-    action=argparse.BooleanOptionalAction,
-    default=False,
-    help="Add anchor to markdown title.",
-)
-parser.add_argument(
-    "--overwrite",
-    type=bool,
-    action=argparse.BooleanOptionalAction,
-    default=False,
-    help="Overwrite any file in output directory.",
-)
-parser.add_argument(
-    "--exclude-module-name",
-    type=bool,
-    action=argparse.BooleanOptionalAction,
-    default=False,
-    help="Write file to path which exclude module name.",
-)
-parser.add_argument(
-    "--init-file-name",
-    type=str,
-    default="index.md",
-    help="The name of Markdown file from __init__.py, index.md by default.",
-)
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Sophia_doc is a python package to automatically "
+        "generate API documents for Python modules",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("module", type=str, help="Python module names.")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=str,
+        default="doc",
+        help="The directory to write document.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        default="markdown",
+        help="File format of document.",
+    )
+    parser.add_argument(
+        "--docstring-style",
+        type=str,
+        default="auto",
+        help="Docstring style the python module used.",
+    )
+    parser.add_argument(
+        "--ignore-data",
+        type=bool,
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Ignore data in Markdown text.",
+    )
+    parser.add_argument(
+        "--anchor-extend",
+        type=bool,
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Add anchor to markdown title.",
+    )
+    parser.add_argument(
+        "--use-comments",
+        type=bool,
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Use the comments above an object which has no docstring.",
+    )
+    parser.add_argument(
+        "--overwrite",
+        type=bool,
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Overwrite any file in output directory.",
+    )
+    parser.add_argument(
+        "--exclude-module-name",
+        type=bool,
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Write file to path which exclude module name.",
+    )
+    parser.add_argument(
+        "--init-file-name",
+        type=str,
+        default="index.md",
+        help="The name of Markdown file from __init__.py, index.md by default.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of processes used to render the documents.",
+    )
+
+    return parser
 
 
 def cli() -> None:
     """The Sophia-doc Command-line interface."""
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
+    clear_cache()
     if args.format == "markdown":
         builder = MarkdownBuilder(
             ModuleNode(import_module(args.module)),
-            docstring_style=getattr(DocstringStyle, args.docstring_style.upper()),
+            docstring_style=DocstringStyle[args.docstring_style.upper()],
             anchor_extend=args.anchor_extend,
             ignore_data=args.ignore_data,
+            use_comments=args.use_comments,
         )
     else:
         msg = "format argument must be 'markdown'"
@@ -88,6 +109,7 @@ def cli() -> None:
     builder.write(
         args.output_dir,
         overwrite=args.overwrite,
+        jobs=args.jobs,
         exclude_module_name=args.exclude_module_name,
         init_file_name=args.init_file_name,
     )
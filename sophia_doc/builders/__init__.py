@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from docstring_parser import Docstring, DocstringStyle, parse
+from docstring_parser import Docstring, DocstringStyle, ParseError, parse
+
+from sophia_doc.cache import register_cache
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
     from sophia_doc import DocNode, ModuleNode
 
+# file writes are IO bound, ThreadPoolExecutor only starts threads on demand
+_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# the styles tried by DocstringStyle.AUTO, in the order docstring_parser uses
+_STYLES = tuple(style for style in DocstringStyle if style is not DocstringStyle.AUTO)
+
 
 class Builder(ABC):
     """Base class of Builder.
@@ -20,41 +34,69 @@ class Builder(ABC):
     Attributes:
         module: A ModuleNode object.
         docstring_style: The docstring style the module used, auto check by default.
+        use_comments: If true will use the comments above an object which has
+            no docstring instead. Disabled by default, since it has to read and
+            scan the source file of every undocumented object.
     """
 
     module: ModuleNode
     docstring_style: DocstringStyle
+    use_comments: bool
 
     def __init__(
         self,
         module: ModuleNode,
         *,
         docstring_style: DocstringStyle = DocstringStyle.AUTO,
+        use_comments: bool = False,
     ) -> None:
         """Init Builder.
 
         Args:
             module: The Module Node to build.
             docstring_style: The docstring style. Defaults to DocstringStyle.AUTO.
+            use_comments: Use the comments above an object without docstring.
+                Defaults to False.
         """
         super().__init__()
         self.module = module
         self.docstring_style = docstring_style
+        self.use_comments = use_comments
+        self._detected_style: DocstringStyle | None = None
 
     def _new_builder(self, module: ModuleNode) -> Builder:
         """Get a new instance of Builder class, is used in write method."""
-        return self.__class__(module, docstring_style=self.docstring_style)
+        return self.__class__(
+            module,
+            docstring_style=self.docstring_style,
+            use_comments=self.use_comments,
+        )
 
     def get_docstring(self, obj: DocNode[Any]) -> Docstring:
         """Get the Docstring object of a DocNode object.
 
+        With DocstringStyle.AUTO, the style of the last docstring of this module
+        which has any sections is tried first, and its result is used as soon as
+        it has any sections. So a docstring mixing several styles can be parsed
+        with the style of the module instead of the one which finds the most
+        sections, and its result depends on the docstrings built before it.
+
         Args:
             obj: A DocNode object.
 
         Returns:
-            A Docstring object.
+            A Docstring object, which is cached and shared between nodes with
+            the same docstring, so it should not be modified.
         """
-        return parse(obj.docstring, style=self.docstring_style)
+        text = obj.docstring
+        if not text and self.use_comments:
+            text = obj.comments
+        docstring = _parse_docstring(text, self.docstring_style, self._detected_style)
+        if docstring.meta and docstring.style is not None:
+            # docstrings of a module nearly always share one style, so try the
+            # detected style first for the next docstrings of this module
+            self._detected_style = docstring.style
+        return docstring
 
     @abstractmethod
     def text(self) -> str:
@@ -66,22 +108,151 @@ class Builder(ABC):
         """Get the path to write file."""
         raise NotImplementedError
 
-    def write(self, output_dir: str, *, overwrite: bool = False, **kwargs: Any) -> None:
+    def write(
+        self,
+        output_dir: str,
+        *,
+        overwrite: bool = False,
+        jobs: int = 1,
+        **kwargs: Any,
+    ) -> None:
         """Write file to output dir.
 
         Args:
             output_dir: The output directory.
             overwrite: If true will overwrite any file in output directory,
                 otherwise raise an Exception when file already exists.
+                Files whose content is unchanged are left untouched.
+            jobs: The number of processes used to render the documents, they
+                are rendered in the current process by default. Every worker
+                process imports the documented modules again, so the builder
+                must be picklable.
             **kwargs: Other args.
         """
-        filepath = Path(output_dir).resolve() / self.get_path(**kwargs)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        if not self.module.is_namespace:
-            filepath.touch(exist_ok=overwrite)
-            with filepath.open("w", encoding="utf-8") as f:
-                f.write(self.text())
-        for submodule in self.module.submodules:
-            self._new_builder(submodule).write(
-                output_dir, overwrite=overwrite, **kwargs
+        documents = self._collect(Path(output_dir).resolve(), jobs=jobs, **kwargs)
+        self._flush(documents, overwrite=overwrite)
+
+    def _walk(self) -> Iterator[Builder]:
+        """Yield the builders of this module and submodules depth-first."""
+        stack: list[Builder] = [self]
+        while stack:
+            builder = stack.pop()
+            yield builder
+            stack.extend(
+                builder._new_builder(submodule)  # noqa: SLF001
+                for submodule in reversed(builder.module.submodules)
             )
+
+    def _collect(
+        self, output_dir: Path, *, jobs: int = 1, **kwargs: Any
+    ) -> Iterator[tuple[Path, str | None]]:
+        """Render the documents of this module and submodules lazily.
+
+        Yields a (path, text) pair per module, text is None for namespace
+        packages, which only need the directory.
+        """
+        if jobs <= 1:
+            for builder in self._walk():
+                yield output_dir / builder.get_path(**kwargs), _render(builder)
+            return
+        # the modules are found in this process, only the rendering, which is
+        # pure Python and bound by the GIL, is spread over the worker processes
+        builders = list(self._walk())
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for builder, text in zip(builders, executor.map(_render, builders)):
+                yield output_dir / builder.get_path(**kwargs), text
+
+    @staticmethod
+    def _flush(
+        documents: Iterable[tuple[Path, str | None]], *, overwrite: bool
+    ) -> None:
+        """Write the documents, each directory is only created once."""
+        # documents are rendered in this thread, the file writes are queued to
+        # a thread pool so rendering does not wait on the filesystem
+        created_dirs: set[Path] = set()
+        futures: list[Future[None]] = []
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+            try:
+                for filepath, text in documents:
+                    # stop rendering once a write failed, e.g. with
+                    # FileExistsError when overwrite is False
+                    futures = _check_writes(futures)
+                    if filepath.parent not in created_dirs:
+                        filepath.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(filepath.parent)
+                    if text is not None:
+                        futures.append(
+                            executor.submit(_write_file, filepath, text, overwrite)
+                        )
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+        for future in futures:
+            future.result()
+
+
+@functools.cache
+def _parse_docstring(
+    text: str, style: DocstringStyle, preferred: DocstringStyle | None = None
+) -> Docstring:
+    """Parse a docstring, the result is cached.
+
+    For the AUTO style, docstring_parser.parse keeps the result with the most
+    meta. Here the preferred style is tried first and its result is used right
+    away if it has any meta, even if another style would find more. Without a
+    preferred style, or when it finds no meta, the result is the same as parse.
+    """
+    if style is not DocstringStyle.AUTO:
+        return parse(text, style=style)
+    results: dict[DocstringStyle, Docstring] = {}
+    error: ParseError | None = None
+    for _style in sorted(_STYLES, key=lambda _style: _style is not preferred):
+        try:
+            docstring = parse(text, style=_style)
+        except ParseError as exc:
+            error = exc
+            continue
+        if _style is preferred and docstring.meta:
+            return docstring
+        results[_style] = docstring
+    if error is not None and not results:
+        raise error
+    # max keeps the first of equal results, like the stable sort of parse
+    return max(
+        (results[_style] for _style in _STYLES if _style in results),
+        key=lambda docstring: len(docstring.meta),
+    )
+
+
+register_cache(_parse_docstring.cache_clear)
+
+
+def _render(builder: Builder) -> str | None:
+    """Render the document of a builder, None for namespace packages."""
+    return None if builder.module.is_namespace else builder.text()
+
+
+def _check_writes(futures: list[Future[None]]) -> list[Future[None]]:
+    """Raise the error of a finished write if any, return the pending writes."""
+    pending: list[Future[None]] = []
+    for future in futures:
+        if future.done():
+            future.result()
+        else:
+            pending.append(future)
+    return pending
+
+
+def _write_file(filepath: Path, text: str, overwrite: bool) -> None:
+    """Write text to a file, raise FileExistsError if not overwrite."""
+    if overwrite:
+        # leave unchanged files alone, so their mtime is kept for incremental
+        # rebuilds of the documentation
+        try:
+            if filepath.read_text(encoding="utf-8") == text:
+                return
+        except (OSError, UnicodeDecodeError):
+            pass
+    # "x" creates the file and fails if it exists, no need to touch it first
+    with filepath.open("w" if overwrite else "x", encoding="utf-8") as f:
+        f.write(text)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import copy
 import inspect
+import os
 import warnings
 from pathlib import Path
-from textwrap import indent
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from docstring_parser import Docstring, DocstringParam, DocstringStyle
 from typing_extensions import override
@@ -15,6 +16,13 @@ from sophia_doc import ClassNode, DataNode, DocNode, FunctionNode, ModuleNode
 from sophia_doc.builders import Builder
 from sophia_doc.utils import format_annotation, format_signature
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_ESCAPE_TABLE = str.maketrans({c: "\\" + c for c in "*#\\()[]<>_`"})
+_ANCHOR_TABLE = str.maketrans(dict.fromkeys("*#\\()[]<>_`.", "-"))
+_TITLE_PREFIXES = tuple("#" * level + " " for level in range(7))
+
 
 def get_description(docstring: Docstring) -> list[str]:
     """Get description form a Docstring object.
@@ -44,12 +52,14 @@ def parser_param(name: str, annotation: str | None, description: str | None) ->
     Returns:
         Formatted string of parameter.
     """
-    result = f"- {Markdown.bold(Markdown.escape(name))}"
-    if annotation:
-        result += f" ({Markdown.italic(Markdown.escape(annotation))})"
-    if description:
-        result += f" - {description}"
-    return result
+    # build the string in one go instead of appending to it
+    annotation_part = (
+        f" ({Markdown.italic(Markdown.escape(annotation))})" if annotation else ""
+    )
+    description_part = f" - {description}" if description else ""
+    return (
+        f"- {Markdown.bold(Markdown.escape(name))}{annotation_part}{description_part}"
+    )
 
 
 def parser_docstring_param(param: DocstringParam) -> str:
@@ -70,17 +80,20 @@ class Markdown:
     @staticmethod
     def escape(text: str) -> str:
         """Escape Markdown control characters."""
-        new_text = ""
-        for c in text:
-            if c in "*#\\()[]<>_`":
-                new_text += "\\"
-            new_text += c
-        return new_text
+        return text.translate(_ESCAPE_TABLE)
 
     @staticmethod
     def indent(text: str, level: int = 1) -> str:
         """Indent."""
-        return indent(text, prefix=" " * (level * 2))
+        prefix = " " * (level * 2)
+        # fast path for a single non-blank line, printable text contains no line
+        # boundary, otherwise keep the semantics of textwrap.indent, which only
+        # indents lines that are not whitespace, but without its per line call
+        if text and text.isprintable() and not text.isspace():
+            return prefix + text
+        return "".join(
+            [prefix + line if line.strip() else line for line in text.splitlines(True)]
+        )
 
     @staticmethod
     def italic(text: str) -> str:
@@ -95,6 +108,8 @@ class Markdown:
     @staticmethod
     def title(text: str, level: int = 1) -> str:
         """Title."""
+        if 0 <= level < len(_TITLE_PREFIXES):
+            return _TITLE_PREFIXES[level] + text
         return "#" * level + " " + text
 
     @staticmethod
@@ -114,6 +129,7 @@ class MarkdownBuilder(Builder):
 
     anchor_extend: bool
     ignore_data: bool
+    _build_methods: dict[type[DocNode[Any]], Callable[..., str]]
 
     def __init__(
         self,
@@ -122,11 +138,19 @@ class MarkdownBuilder(Builder):
         docstring_style: DocstringStyle = DocstringStyle.AUTO,
         anchor_extend: bool = False,
         ignore_data: bool = False,
+        use_comments: bool = False,
     ) -> None:
         """Init Markdown Builder."""
-        super().__init__(module, docstring_style=docstring_style)
+        super().__init__(
+            module, docstring_style=docstring_style, use_comments=use_comments
+        )
         self.anchor_extend = anchor_extend
         self.ignore_data = ignore_data
+        self._build_methods = {
+            ClassNode: self.build_class,
+            FunctionNode: self.build_function,
+            DataNode: self.build_data,
+        }
 
     @override
     def _new_builder(self, module: ModuleNode) -> Builder:
@@ -135,6 +159,7 @@ class MarkdownBuilder(Builder):
             docstring_style=self.docstring_style,
             anchor_extend=self.anchor_extend,
             ignore_data=self.ignore_data,
+            use_comments=self.use_comments,
         )
 
     @override
@@ -153,10 +178,11 @@ class MarkdownBuilder(Builder):
             init_file_name: The name of Markdown file
                 from __init__.py, `index.md` by default.
         """
+        name = self.module.name
         if exclude_module_name:
-            path = Path(*self.module.name.split(".")[1:])
-        else:
-            path = Path(*self.module.name.split(".")[0:])
+            name = name.partition(".")[2]
+        # a single joined string is parsed once, instead of one part per segment
+        path = Path(name.replace(".", os.sep))
         return (
             path / init_file_name if self.module.is_package else path.with_suffix(".md")
         )
@@ -176,7 +202,8 @@ class MarkdownBuilder(Builder):
 
     @staticmethod
     def _build_str(str_list: list[str]) -> str:
-        return "\n\n".join(filter(lambda x: x, str_list))
+        # filter(None, ...) drops the empty strings without a Python level call
+        return "\n\n".join(filter(None, str_list))
 
     def build_doc(self, node: DocNode[Any], *, level: int = 1, **kwargs: Any) -> str:
         """Build markdown string from a DocNode.
@@ -189,6 +216,10 @@ class MarkdownBuilder(Builder):
         Returns:
             A markdown string.
         """
+        build_method = self._build_methods.get(type(node))
+        if build_method is not None:
+            return build_method(node, level=level, **kwargs)
+        # subclasses of the node classes
         if isinstance(node, ClassNode):
             return self.build_class(node, level=level, **kwargs)
         if isinstance(node, FunctionNode):
@@ -200,10 +231,7 @@ class MarkdownBuilder(Builder):
     def _extend_title(self, title: str, node: DocNode[Any]) -> str:
         if not self.anchor_extend:
             return title
-        anchor = node.qualname
-        for c in "*#\\()[]<>_`.":
-            anchor = anchor.replace(c, "-")
-        return title + " {#" + anchor + "}"
+        return title + " {#" + node.qualname.translate(_ANCHOR_TABLE) + "}"
 
     def build_class(self, node: ClassNode, *, level: int = 1, **_kwagrs: Any) -> str:
         """Build markdown string from a ClassNode.
@@ -225,18 +253,19 @@ class MarkdownBuilder(Builder):
         kind = " ".join(_kind)
 
         result: list[str] = []
-        title = Markdown.title(
-            Markdown.italic(kind) + " " + Markdown.inline_code(node.name), level + 1
-        )
+        title = Markdown.title(f"_{kind}_ `{node.name}`", level + 1)
         result.append(self._extend_title(title, node))
 
-        result.append("Bases: " + ", ".join(map(Markdown.inline_code, node.bases)))
+        result.append("Bases: " + ", ".join(f"`{base}`" for base in node.bases))
 
         docstring = self.get_docstring(node)
         result.extend(get_description(docstring))
 
-        if docstring.params or node.annotations:
+        # the Docstring accessors scan all the meta on every access
+        param_docs = docstring.params
+        if param_docs or node.annotations:
             result.append("- **Attributes**")
+            base_module = node.module.name
 
             parma_dict: dict[
                 str, tuple[inspect.Parameter | None, DocstringParam | None]
@@ -248,35 +277,35 @@ class MarkdownBuilder(Builder):
                     if not key.startswith("_")
                 }
 
-            if docstring.params:
-                for param_doc in docstring.params:
-                    annotation, _ = parma_dict.get(param_doc.arg_name, (None, None))
-                    if param_doc.type_name is None and annotation:
-                        param_doc.type_name = format_annotation(
-                            annotation, base_module=node.module.name
-                        )
-                    parma_dict[param_doc.arg_name] = (annotation, param_doc)
-
-            for name, (annotation, param_doc) in parma_dict.items():
-                if param_doc is None:
-                    result.append(
-                        Markdown.indent(
-                            parser_param(
-                                name,
-                                annotation
-                                and format_annotation(
-                                    annotation, base_module=node.module.name
-                                ),
-                                None,
-                            )
-                        )
+            for _param_doc in param_docs:
+                param_doc = _param_doc
+                annotation, _ = parma_dict.get(param_doc.arg_name, (None, None))
+                if param_doc.type_name is None and annotation:
+                    # the parsed docstring is cached and shared, copy it
+                    param_doc = copy.copy(param_doc)
+                    param_doc.type_name = format_annotation(
+                        annotation, base_module=base_module
                     )
-                else:
-                    result.append(Markdown.indent(parser_docstring_param(param_doc)))
+                parma_dict[param_doc.arg_name] = (annotation, param_doc)
 
-        if docstring.examples:
+            result.extend(
+                Markdown.indent(
+                    parser_param(
+                        name,
+                        annotation
+                        and format_annotation(annotation, base_module=base_module),
+                        None,
+                    )
+                    if param_doc is None
+                    else parser_docstring_param(param_doc)
+                )
+                for name, (annotation, param_doc) in parma_dict.items()
+            )
+
+        examples = docstring.examples
+        if examples:
             result.append("- **Examples**")
-            result.append(Markdown.indent(docstring.examples[0].description or ""))
+            result.append(Markdown.indent(examples[0].description or ""))
 
         for _name, kind, node_ in node.attributes:
             result.append(
@@ -295,59 +324,83 @@ class MarkdownBuilder(Builder):
         node: FunctionNode, docstring: Docstring, *, ignore_first_arg: bool = False
     ) -> list[str]:
         result: list[str] = []
-        if docstring.params or (node.signature and node.signature.parameters):
-            parma_dict: dict[
-                str, tuple[inspect.Parameter | None, DocstringParam | None]
-            ] = {}
-            if node.signature and node.signature.parameters:
-                for _key, param in node.signature.parameters.items():
-                    key = _key
-                    if param.kind == param.VAR_POSITIONAL:
-                        key = "*" + key
-                    elif param.kind == param.VAR_KEYWORD:
-                        key = "**" + key
-                    parma_dict[key] = (param, None)
-
-            if docstring.params:
-                for param_doc in docstring.params:
-                    if (
-                        param_doc.arg_name not in parma_dict
-                        and node.signature
-                        and node.signature.parameters
-                    ):
-                        warnings.warn(
-                            f'The argument "{param_doc.arg_name}" of {node.qualname} '
-                            f"can not find in function signature.",
-                            stacklevel=1,
-                        )
-                    param, _ = parma_dict.get(param_doc.arg_name, (None, None))
-                    if param_doc.type_name is None and param:
-                        param_doc.type_name = format_annotation(
-                            param.annotation, base_module=node.module.name
-                        )
-                    parma_dict[param_doc.arg_name] = (param, param_doc)
+        base_module = node.module.name
+        signature = node.signature
+        parameters = signature.parameters if signature is not None else None
+        param_docs = docstring.params
+        if not param_docs:
+            # nothing to merge, build the arguments from the signature directly
+            if not parameters:
+                return result
+            params = list(parameters.values())
+            if ignore_first_arg:
+                del params[0]
+            if params:
+                result.append("- **Arguments**")
+            result.extend(
+                Markdown.indent(
+                    parser_param(
+                        param.name,
+                        format_annotation(param.annotation, base_module=base_module),
+                        None,
+                    )
+                )
+                for param in params
+            )
+            return result
+
+        parma_dict: dict[
+            str, tuple[inspect.Parameter | None, DocstringParam | None]
+        ] = {}
+        if parameters:
+            var_positional = inspect.Parameter.VAR_POSITIONAL
+            var_keyword = inspect.Parameter.VAR_KEYWORD
+            for _key, param in parameters.items():
+                key = _key
+                if param.kind == var_positional:
+                    key = "*" + key
+                elif param.kind == var_keyword:
+                    key = "**" + key
+                parma_dict[key] = (param, None)
+
+        for _param_doc in param_docs:
+            param_doc = _param_doc
+            if param_doc.arg_name not in parma_dict and parameters:
+                warnings.warn(
+                    f'The argument "{param_doc.arg_name}" of {node.qualname} '
+                    f"can not find in function signature.",
+                    stacklevel=1,
+                )
+            param, _ = parma_dict.get(param_doc.arg_name, (None, None))
+            if param_doc.type_name is None and param:
+                # the parsed docstring is cached and shared, copy it
+                param_doc = copy.copy(param_doc)
+                param_doc.type_name = format_annotation(
+                    param.annotation, base_module=base_module
+                )
+            parma_dict[param_doc.arg_name] = (param, param_doc)
 
-            if ignore_first_arg and parma_dict:
-                parma_dict.pop(next(iter(parma_dict.keys())))
+        if ignore_first_arg and parma_dict:
+            parma_dict.pop(next(iter(parma_dict)))
 
-            if parma_dict:
-                result.append("- **Arguments**")
+        if parma_dict:
+            result.append("- **Arguments**")
 
-            for param, param_doc in parma_dict.values():
-                if param_doc is not None:
-                    result.append(Markdown.indent(parser_docstring_param(param_doc)))
-                elif param is not None:
-                    result.append(
-                        Markdown.indent(
-                            parser_param(
-                                param.name,
-                                format_annotation(
-                                    param.annotation, base_module=node.module.name
-                                ),
-                                None,
-                            )
+        for param, param_doc in parma_dict.values():
+            if param_doc is not None:
+                result.append(Markdown.indent(parser_docstring_param(param_doc)))
+            elif param is not None:
+                result.append(
+                    Markdown.indent(
+                        parser_param(
+                            param.name,
+                            format_annotation(
+                                param.annotation, base_module=base_module
+                            ),
+                            None,
                         )
                     )
+                )
 
         return result
 
@@ -372,7 +425,8 @@ class MarkdownBuilder(Builder):
         Returns:
             A markdown string.
         """
-        if not node.signature:
+        signature = node.signature
+        if not signature:
             warnings.warn(
                 f"The {node.qualname} ({node.obj}) not have signature, ignored.",
                 stacklevel=1,
@@ -391,11 +445,7 @@ class MarkdownBuilder(Builder):
         result.append(
             self._extend_title(
                 Markdown.title(
-                    Markdown.italic(kind)
-                    + " "
-                    + Markdown.inline_code(
-                        f"{node.name}{format_signature(node.signature)}"
-                    ),
+                    f"_{kind}_ `{node.name}{format_signature(signature)}`",
                     level + 1,
                 ),
                 node,
@@ -409,21 +459,17 @@ class MarkdownBuilder(Builder):
             self._build_argument(node, docstring, ignore_first_arg=ignore_first_arg)
         )
 
-        if (
-            docstring.returns is not None
-            or node.signature.return_annotation is not inspect.Signature.empty
-        ):
+        returns = docstring.returns
+        return_annotation = signature.return_annotation
+        if returns is not None or return_annotation is not inspect.Signature.empty:
             result.append("- **Returns**")
 
             type_name = ""
-            if (
-                docstring.returns is not None
-                and docstring.returns.type_name is not None
-            ):
-                type_name = docstring.returns.type_name
-            elif node.signature.return_annotation is not inspect.Signature.empty:
+            if returns is not None and returns.type_name is not None:
+                type_name = returns.type_name
+            elif return_annotation is not inspect.Signature.empty:
                 type_name = format_annotation(
-                    node.signature.return_annotation, base_module=node.module.name
+                    return_annotation, base_module=node.module.name
                 )
 
             if type_name:
@@ -433,10 +479,11 @@ class MarkdownBuilder(Builder):
                     )
                 )
 
-            if docstring.returns and docstring.returns.description:
-                result.append(Markdown.indent(docstring.returns.description))
+            if returns and returns.description:
+                result.append(Markdown.indent(returns.description))
 
-        if docstring.raises:
+        raises = docstring.raises
+        if raises:
             result.append("- **Raises**")
             result.extend(
                 Markdown.indent(
@@ -447,12 +494,13 @@ class MarkdownBuilder(Builder):
                         description=raise_doc.description,
                     )
                 )
-                for raise_doc in docstring.raises
+                for raise_doc in raises
             )
 
-        if docstring.examples:
+        examples = docstring.examples
+        if examples:
             result.append("- **Examples**")
-            result.append(Markdown.indent(docstring.examples[0].description or ""))
+            result.append(Markdown.indent(examples[0].description or ""))
 
         return self._build_str(result)
 
@@ -480,10 +528,7 @@ class MarkdownBuilder(Builder):
         result: list[str] = []
         result.append(
             self._extend_title(
-                Markdown.title(
-                    Markdown.italic(kind) + " " + Markdown.inline_code(node.name),
-                    level + 1,
-                ),
+                Markdown.title(f"_{kind}_ `{node.name}`", level + 1),
                 node,
             )
         )
@@ -0,0 +1,65 @@
+"""Caches shared by the modules of sophia_doc."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from typing_extensions import Concatenate, ParamSpec
+
+    _P = ParamSpec("_P")
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+
+_CACHE_CLEARS: list[Callable[[], None]] = []
+
+
+def register_cache(cache_clear: Callable[[], None]) -> None:
+    """Register a cache to be cleared by clear_caches.
+
+    Args:
+        cache_clear: The function which clears the cache.
+    """
+    _CACHE_CLEARS.append(cache_clear)
+
+
+def identity_cache(
+    func: Callable[Concatenate[_K, _P], _T],
+) -> Callable[Concatenate[_K, _P], _T]:
+    """Cache the results of a function per identity of its first argument.
+
+    For objects which are unhashable or compare by value, like annotations and
+    signatures. The cache holds a strong reference to the first argument, so
+    its id can not be reused while the result is cached. The other arguments
+    are part of the key and must be hashable.
+
+    Args:
+        func: The function to be cached.
+
+    Returns:
+        The cached function.
+    """
+    cache: dict[tuple[Any, ...], tuple[Any, Any]] = {}
+    register_cache(cache.clear)
+
+    @functools.wraps(func)
+    def wrapper(obj: _K, /, *args: _P.args, **kwargs: _P.kwargs) -> _T:
+        key = (id(obj), *args, *kwargs.items())
+        cached = cache.get(key)
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        result = func(obj, *args, **kwargs)
+        cache[key] = (obj, result)
+        return result
+
+    return wrapper
+
+
+def clear_caches() -> None:
+    """Clear all the registered caches, including the identity caches."""
+    for cache_clear in _CACHE_CLEARS:
+        cache_clear()
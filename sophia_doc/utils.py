@@ -9,9 +9,13 @@ import traceback
 import warnings
 from typing import TYPE_CHECKING, Any
 
+from sophia_doc.cache import identity_cache
+
 if TYPE_CHECKING:
     from types import ModuleType
 
+_FORWARD_REF_RE = re.compile(r"\bForwardRef\((?P<quot>['\"])(?P<string>.*?)(?P=quot)\)")
+
 
 def import_module(modname: str) -> ModuleType:
     """A wrapper of importlib.import_module, convert exceptions to ImportError.
@@ -49,12 +53,17 @@ def format_annotation(annotation: Any, base_module: str | None = None) -> str:
         return ""
     if isinstance(annotation, str):
         return annotation
+    return _format_annotation(annotation, base_module)
+
+
+@identity_cache
+def _format_annotation(annotation: Any, base_module: str | None) -> str:
+    """Format an annotation object, the same objects are used all over a package."""
+    result = inspect.formatannotation(annotation, base_module)
     # use regex delete 'ForwardRef' from annotation
-    return re.sub(
-        r"\bForwardRef\((?P<quot>[\'\"])(?P<string>.*?)(?P=quot)\)",
-        r"\g<string>",
-        inspect.formatannotation(annotation, base_module),
-    )
+    if "ForwardRef(" in result:
+        result = _FORWARD_REF_RE.sub(r"\g<string>", result)
+    return result
 
 
 def format_parameter(parameter: inspect.Parameter, type_comments: bool = False) -> str:
@@ -90,6 +99,7 @@ def format_parameter(parameter: inspect.Parameter, type_comments: bool = False)
     return formatted
 
 
+@identity_cache
 def format_signature(signature: inspect.Signature, type_comments: bool = False) -> str:
     """Format inspect.Signature object, type comments is optional.
 